@@ -13,6 +13,8 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 # Google Text-to-Speech settings
 TTS_LANGUAGE = "fr"
 TTS_SLOW = False  # Set to True for slower pronunciation
+TTS_MAX_WORKERS = 16  # Number of audio files to download from Google TTS at once
+AUDIO_CACHE_MAX_AGE_DAYS = 180  # Delete cached audio unused for this many days (None to keep forever)
 
 # Google Sheets settings
 GOOGLE_CREDENTIALS_FILE = "credentials.json"  # Path to your Google service account credentials
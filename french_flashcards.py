@@ -5,6 +5,8 @@ Generates audio pronunciation and creates Anki flashcards from
 English-French vocabulary pairs.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import csv
@@ -12,90 +14,278 @@ import argparse
 import re
 import random
 import json
-from typing import List, Dict, Tuple, Optional
+import base64
+import time
+import gc
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
 from gtts import gTTS
+from gtts.tts import gTTSError
 import genanki
 import hashlib
-import gspread
-from google.oauth2.service_account import Credentials
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
 
+# orjson is an optional, faster drop-in for reading and writing the sheet cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# gspread and google-auth are only needed in Google Sheets mode, so they are
+# imported where used to keep CSV-mode startup fast
+if TYPE_CHECKING:
+    import gspread
+
+
+# Card-only markup removed before speaking: parenthetical notes such as "(m)"
+# and HTML tags
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_TAG_RE = re.compile(r'<[^>]+>')
+_MULTI_PERIOD_RE = re.compile(r'\.{2,}')
+
+# Audio payload inside Google TTS batchexecute responses
+_TTS_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+# Files this tool writes to AUDIO_DIR: 16-hex audio names from
+# get_audio_filename, 32-hex MD5 names from older versions, and the
+# <name>.mp3.<thread id>.part temp files from download_audio
+_AUDIO_CACHE_FILE_RE = re.compile(r'^(?:[0-9a-f]{16}|[0-9a-f]{32})\.mp3(?:\.\d+\.part)?$')
+
+# Keep-alive connection pool for Google TTS, shared by the download threads.
+# Retries also cover throttling (429) and server errors, including for the
+# POST requests gTTS sends, which urllib3 doesn't retry by default.
+_TTS_SESSION = requests.Session()
+_TTS_SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=config.TTS_MAX_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None)))
+
+# Anki note type shared by every deck (the ID must stay stable across runs)
+_FLASHCARD_MODEL = genanki.Model(
+    1607392319,
+    'French Vocabulary',
+    fields=[
+        {'name': 'English'},
+        {'name': 'French'},
+        {'name': 'Audio'},
+    ],
+    templates=[
+        {
+            'name': 'Card 1',
+            'qfmt': '{{English}}',
+            'afmt': '{{FrontSide}}<hr id="answer">{{French}}<br>{{Audio}}',
+        },
+    ],
+    css='''
+        .card {
+            font-family: arial;
+            font-size: 20px;
+            text-align: center;
+            color: black;
+            background-color: white;
+        }
+    '''
+)
+
+
+def clean_audio_text(text: str) -> str:
+    """Strip card-only markup from text so only the spoken French remains."""
+    # Remove anything in parentheses before generating audio
+    clean_text = _PAREN_RE.sub('', text) if '(' in text else text
+
+    if '<' in clean_text:
+        # Replace <br> tags with period + space to create natural pauses
+        clean_text = clean_text.replace('<br>', '. ')
+
+        # Remove remaining HTML tags before generating audio
+        clean_text = _TAG_RE.sub('', clean_text)
+
+    # Clean up any double periods or extra spaces
+    if '..' in clean_text:
+        clean_text = _MULTI_PERIOD_RE.sub('.', clean_text)  # Multiple periods -> single period
+
+    # Collapse whitespace runs to single spaces and trim, in one pass
+    return ' '.join(clean_text.split())
+
+
+def get_spoken_text(item: Dict[str, str]) -> Optional[str]:
+    """
+    Get the cleaned text to pronounce for a word.
+    Returns None if the word has no French translation, since no card is made for it.
+    """
+    french = item.get('French', '').strip()
+    if not french:
+        return None
+
+    # Use AudioText if available (for swapped columns)
+    # AudioText contains the French text even when columns are swapped
+    return clean_audio_text(item.get('AudioText', french))
+
+
+def get_audio_filename(clean_text: str) -> str:
+    """
+    Build the audio filename from the spoken text and TTS settings.
+    Identical speech always maps to the same file, so it doubles as a cache key.
+    """
+    key = f"{clean_text}|{config.TTS_LANGUAGE}|{config.TTS_SLOW}"
+    return f"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}.mp3"
+
+
+def get_deck_id(deck_name: str) -> int:
+    """Generate unique deck ID from deck name so Anki doesn't merge decks."""
+    return int(hashlib.md5(deck_name.encode()).hexdigest()[:8], 16)
+
+
+class _PooledTTS(gTTS):
+    """
+    gTTS that sends its requests through the shared keep-alive session.
+    Stock gTTS opens a new Session (and TLS handshake) for every request.
+    """
+
+    def stream(self):
+        """Do the TTS API request(s) and yield the decoded mp3 bytes."""
+        for prepared_request in self._prepare_requests():
+            try:
+                response = _TTS_SESSION.send(prepared_request, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                # Request successful, bad response
+                raise gTTSError(tts=self, response=response)
+            except requests.exceptions.RequestException:
+                # Request failed
+                raise gTTSError(tts=self)
+
+            for line in response.iter_lines(chunk_size=1024):
+                decoded_line = line.decode('utf-8')
+                if 'jQ1olc' in decoded_line:
+                    audio_search = _TTS_AUDIO_RE.search(decoded_line)
+                    if not audio_search:
+                        # Request successful, good response, but no audio in it
+                        raise gTTSError(tts=self, response=response)
+                    yield base64.b64decode(audio_search.group(1).encode('ascii'))
+
+
+def download_audio(text: str, filepath: str):
+    """Download Google TTS audio for text to filepath unless it is already on disk."""
+    if os.path.exists(filepath):
+        # Refresh the modified time so prune_audio_cache sees it as recently
+        # used. This is only a pruning hint, so the cached file is still
+        # used if it can't be touched (e.g. owned by another user).
+        try:
+            os.utime(filepath)
+        except OSError:
+            pass
+        return
+
+    # Write to a temp file first so an interrupted download
+    # never leaves a truncated mp3 that looks like a cache hit
+    tmp_filepath = f"{filepath}.{threading.get_ident()}.part"
+    tts = _PooledTTS(text=text, lang=config.TTS_LANGUAGE, slow=config.TTS_SLOW)
+    try:
+        tts.save(tmp_filepath)
+    except BaseException:
+        # Don't leave a partial download behind
+        try:
+            os.remove(tmp_filepath)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp_filepath, filepath)
+
+
+def prefetch_audio(word_lists: List[List[Dict[str, str]]]):
+    """
+    Download audio for several decks through one shared thread pool.
+    Decks built afterwards find their audio already on disk.
+    """
+    unique_audio = {}
+    for words in word_lists:
+        for item in words:
+            clean_text = get_spoken_text(item)
+            if clean_text is not None and clean_text not in unique_audio:
+                unique_audio[clean_text] = os.path.join(config.AUDIO_DIR, get_audio_filename(clean_text))
+
+    # Failures are ignored here - generate_audio retries and reports them
+    # when the deck is built
+    with ThreadPoolExecutor(max_workers=config.TTS_MAX_WORKERS) as executor:
+        for clean_text, filepath in unique_audio.items():
+            executor.submit(download_audio, clean_text, filepath)
+
+
+def prune_audio_cache(max_age_days: Optional[int]):
+    """Delete cached audio files that no deck has used in max_age_days.
+
+    Only files this tool created are considered; anything else in
+    AUDIO_DIR is left alone.
+    """
+    if max_age_days is None:
+        return
+
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    removed = 0
+
+    for entry in os.scandir(config.AUDIO_DIR):
+        # .part files are leftovers from interrupted downloads
+        if not _AUDIO_CACHE_FILE_RE.match(entry.name):
+            continue
+
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError as e:
+            print(f"Warning: Could not prune audio file '{entry.name}': {e}")
+
+    if removed:
+        print(f"Removed {removed} audio file(s) unused for {max_age_days} days")
+
 
 class FrenchFlashcardGenerator:
     """Generate French flashcards with audio pronunciation."""
 
     def __init__(self, deck_name: str = 'French Vocabulary'):
         self.audio_files = []
+        self.audio_file_set = set()
+        self.audio_lock = threading.Lock()
+        self.audio_failures = 0  # Set by process_words
         self.deck_name = deck_name
 
-        # Create Anki model for flashcards
-        self.model = genanki.Model(
-            1607392319,
-            'French Vocabulary',
-            fields=[
-                {'name': 'English'},
-                {'name': 'French'},
-                {'name': 'Audio'},
-            ],
-            templates=[
-                {
-                    'name': 'Card 1',
-                    'qfmt': '{{English}}',
-                    'afmt': '{{FrontSide}}<hr id="answer">{{French}}<br>{{Audio}}',
-                },
-            ],
-            css='''
-                .card {
-                    font-family: arial;
-                    font-size: 20px;
-                    text-align: center;
-                    color: black;
-                    background-color: white;
-                }
-            '''
-        )
-
-        # Generate unique deck ID from deck name
-        deck_id = int(hashlib.md5(deck_name.encode()).hexdigest()[:8], 16)
+        # All decks share the same note type
+        self.model = _FLASHCARD_MODEL
 
         # Create deck with custom name and unique ID
         self.deck = genanki.Deck(
-            deck_id,
+            get_deck_id(deck_name),
             deck_name)
 
-    def get_french_translation(self, english: str, french: str = None) -> str:
+    def generate_audio(self, text: str, filename: str) -> str:
         """
-        Get French translation from provided value.
-        French translation must be provided - no automatic lookup.
+        Generate audio file for cleaned French text using Google TTS.
+        Reuses the file from a previous run if it already exists on disk.
         """
-        if french and french.strip():
-            return french.strip()
+        filepath = os.path.join(config.AUDIO_DIR, filename)
 
-        # No French translation provided - this is an error
-        print(f"Error: Missing French translation for '{english}'")
-        return ""
+        # Already attached to this deck (same French used by several cards)
+        with self.audio_lock:
+            if filepath in self.audio_file_set:
+                return filename
 
-    def generate_audio(self, text: str, filename: str) -> str:
-        """Generate audio file for French text using Google TTS."""
         try:
-            # Remove anything in parentheses before generating audio
-            clean_text = re.sub(r'\([^)]*\)', '', text).strip()
-
-            # Replace <br> tags with period + space to create natural pauses
-            clean_text = clean_text.replace('<br>', '. ')
+            download_audio(text, filepath)
 
-            # Remove remaining HTML tags before generating audio
-            clean_text = re.sub(r'<[^>]+>', '', clean_text).strip()
-
-            # Clean up any double periods or extra spaces
-            clean_text = re.sub(r'\.+', '.', clean_text)  # Multiple periods -> single period
-            clean_text = re.sub(r'\s+', ' ', clean_text)  # Multiple spaces -> single space
-            clean_text = clean_text.strip()
-
-            filepath = os.path.join(config.AUDIO_DIR, filename)
-            tts = gTTS(text=clean_text, lang=config.TTS_LANGUAGE, slow=config.TTS_SLOW)
-            tts.save(filepath)
-            self.audio_files.append(filepath)
+            # Called from worker threads, so guard the shared media list
+            with self.audio_lock:
+                if filepath not in self.audio_file_set:
+                    self.audio_files.append(filepath)
+                    self.audio_file_set.add(filepath)
             return filename
         except Exception as e:
             print(f"Error generating audio for '{text}': {e}")
@@ -106,9 +296,15 @@ class FrenchFlashcardGenerator:
         # Format audio
         audio_tag = f"[sound:{audio_filename}]" if audio_filename else ""
 
+        # Reproduce the GUID genanki derived when audio files were named by
+        # MD5 of the English text, so re-importing a deck updates the cards
+        # already in Anki (keeping review history) instead of adding
+        # duplicates. Like the deck ID, this must never change.
+        legacy_audio_tag = f"[sound:{hashlib.md5(english.encode()).hexdigest()}.mp3]"
         note = genanki.Note(
             model=self.model,
-            fields=[english, french, audio_tag]
+            fields=[english, french, audio_tag],
+            guid=genanki.guid_for(english, french, legacy_audio_tag)
         )
         self.deck.add_note(note)
 
@@ -116,43 +312,66 @@ class FrenchFlashcardGenerator:
         """
         Process a list of English words/phrases with French translations.
         words: List of dicts with 'English', 'French', and 'AudioText' keys
-        Returns a dictionary with processing details.
+        Returns a dictionary with processing details. The number of audio
+        files that could not be generated is stored in self.audio_failures.
         """
         results = {}
+        cards = []
+        # Unique spoken text -> audio filename, so each phrase is fetched once
+        unique_audio = {}
 
         for item in words:
             english = item['English']
-            french_provided = item.get('French', '').strip()
-
-            # Get French translation (must be provided)
-            french = self.get_french_translation(english, french_provided)
+            clean_text = get_spoken_text(item)
 
-            # Skip if no French translation
-            if not french:
+            # Skip if no French translation (it must be provided - no automatic lookup)
+            if clean_text is None:
+                print(f"Error: Missing French translation for '{english}'")
                 print(f"Skipping: {english} (no translation provided)")
                 continue
 
+            french = item['French'].strip()
+
             print(f"Processing: {english}")
 
-            # Generate audio filename (use hash to avoid special characters)
-            audio_filename = f"{hashlib.md5(english.encode()).hexdigest()}.mp3"
+            # Audio filename is a hash of the spoken text, so unchanged words
+            # reuse the mp3 from earlier runs instead of calling Google again
+            if clean_text not in unique_audio:
+                unique_audio[clean_text] = get_audio_filename(clean_text)
 
-            # Get text for audio - use AudioText if available (for swapped columns)
-            # AudioText contains the French text even when columns are swapped
-            audio_text = item.get('AudioText', french)
+            cards.append((english, french, clean_text))
 
-            # Generate audio
-            generated_audio = self.generate_audio(audio_text, audio_filename)
+            print(f"  → {french}")
 
-            # Create flashcard
-            self.create_flashcard(english, french, generated_audio)
+        # Generate audio concurrently - each gTTS call is a blocking network
+        # round-trip, so threads overlap the waiting instead of serializing it
+        with ThreadPoolExecutor(max_workers=config.TTS_MAX_WORKERS) as executor:
+            generated = dict(zip(unique_audio, executor.map(
+                self.generate_audio, unique_audio.keys(), unique_audio.values())))
+
+        self.audio_failures = sum(1 for filename in generated.values() if not filename)
+        if self.audio_failures:
+            print(f"Warning: Could not generate {self.audio_failures} audio file(s); "
+                  "those cards have no sound")
+
+        # Every note stays referenced by the deck, so the cyclic garbage
+        # collector has nothing to free here - pause it while building notes
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for english, french, clean_text in cards:
+                generated_audio = generated[clean_text]
 
-            results[english] = {
-                'french': french,
-                'audio': generated_audio
-            }
+                # Create flashcard
+                self.create_flashcard(english, french, generated_audio)
 
-            print(f"  → {french}")
+                results[english] = {
+                    'french': french,
+                    'audio': generated_audio
+                }
+        finally:
+            if gc_was_enabled:
+                gc.enable()
 
         return results
 
@@ -177,20 +396,34 @@ def load_words_from_csv(filename: str = 'example_words.csv') -> List[Dict[str, s
     """Load words from CSV file with English and French columns."""
     words = []
     with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        # Plain reader with column indexes avoids building a dict per row
+        reader = csv.reader(f)
 
         # Check if headers are present to detect column swap
-        fieldnames = reader.fieldnames if reader.fieldnames else []
+        fieldnames = [name.strip().lower() for name in next(reader, [])]
         columns_swapped = (len(fieldnames) >= 2 and
-                          fieldnames[0].strip().lower() == 'french' and
-                          fieldnames[1].strip().lower() == 'english')
+                          fieldnames[0] == 'french' and
+                          fieldnames[1] == 'english')
+
+        if 'english' not in fieldnames:
+            print(f"Error: CSV file '{filename}' has no English column.")
+            sys.exit(1)
+
+        english_idx = fieldnames.index('english')
+        french_idx = fieldnames.index('french') if 'french' in fieldnames else None
 
         for row in reader:
+            # Skip blank lines (DictReader used to do this for us)
+            if not row:
+                continue
+
+            english_text = row[english_idx] if english_idx < len(row) else ''
+            french_text = row[french_idx].strip() if french_idx is not None and french_idx < len(row) else ''
+
             if columns_swapped:
                 # French in first column, English in second
                 # Swap them so French appears on front of card
-                french_text = row.get('French', '').strip()
-                english_text = row.get('English', '').strip()
+                english_text = english_text.strip()
                 words.append({
                     'English': french_text,      # Actually French - will appear on front
                     'French': english_text,      # Actually English - will appear on back
@@ -199,15 +432,23 @@ def load_words_from_csv(filename: str = 'example_words.csv') -> List[Dict[str, s
             else:
                 # Normal: English first, French second
                 words.append({
-                    'English': row['English'],
-                    'French': row.get('French', '').strip(),
-                    'AudioText': row.get('French', '').strip()
+                    'English': english_text,
+                    'French': french_text,
+                    'AudioText': french_text
                 })
     return words
 
 
+@functools.lru_cache(maxsize=1)
 def get_google_sheets_client():
-    """Create and return authenticated Google Sheets client."""
+    """
+    Create and return authenticated Google Sheets client.
+    The client is cached so any additional caller reuses it instead of
+    repeating the OAuth token exchange.
+    """
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     try:
         scopes = [
             'https://www.googleapis.com/auth/spreadsheets.readonly',
@@ -230,21 +471,51 @@ def get_google_sheets_client():
         sys.exit(1)
 
 
-def get_all_sheet_names(spreadsheet_id: str) -> List[str]:
-    """Get list of all sheet names in a spreadsheet."""
+def open_spreadsheet(spreadsheet_id: str) -> gspread.Spreadsheet:
+    """
+    Open a spreadsheet by ID with an authenticated client.
+    main opens it once and passes the handle to every sheet operation.
+    """
+    import gspread
+
     try:
         client = get_google_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        return [worksheet.title for worksheet in spreadsheet.worksheets()]
+        return client.open_by_key(spreadsheet_id)
     except gspread.exceptions.SpreadsheetNotFound:
         print(f"Error: Spreadsheet with ID '{spreadsheet_id}' not found.")
         print("Check that the spreadsheet ID is correct and shared with your service account.")
         sys.exit(1)
+    except Exception as e:
+        print(f"Error opening spreadsheet: {e}")
+        sys.exit(1)
+
+
+def get_spreadsheet_modified_time(spreadsheet: gspread.Spreadsheet) -> Optional[str]:
+    """
+    Get the spreadsheet's last modified time from Google Drive.
+    Returns None if it can't be read, in which case every sheet is checked by content.
+    """
+    try:
+        return spreadsheet.get_lastUpdateTime()
+    except Exception as e:
+        print(f"Warning: Could not get spreadsheet modified time: {e}")
+        return None
+
+
+def get_all_sheet_names(spreadsheet: gspread.Spreadsheet) -> List[str]:
+    """Get list of all sheet names in a spreadsheet."""
+    try:
+        return [worksheet.title for worksheet in spreadsheet.worksheets()]
     except Exception as e:
         print(f"Error getting sheet names: {e}")
         sys.exit(1)
 
 
+def get_plain_cell_text(cell_data: dict) -> str:
+    """Get a Google Sheets cell's text without any formatting."""
+    return cell_data.get('formattedValue', '').strip()
+
+
 def apply_text_formatting(cell_data: dict) -> str:
     """
     Apply HTML formatting based on Google Sheets cell formatting.
@@ -253,131 +524,140 @@ def apply_text_formatting(cell_data: dict) -> str:
     if not cell_data:
         return ""
 
-    # Get the formatted value first
+    # Get the formatted value first - blank cells need no formatting
     formatted_value = cell_data.get('formattedValue', '')
+    if not formatted_value:
+        return ""
 
     # Check if there are text format runs (mixed formatting within cell)
-    text_format_runs = cell_data.get('textFormatRuns', [])
+    text_format_runs = cell_data.get('textFormatRuns')
 
-    if text_format_runs:
-        # Cell has mixed formatting - process each run
-        result = []
-        text = formatted_value
-
-        for i, run in enumerate(text_format_runs):
-            start_index = run.get('startIndex', 0)
-            # Get end index from next run, or end of string
-            end_index = text_format_runs[i + 1].get('startIndex', len(text)) if i + 1 < len(text_format_runs) else len(text)
-
-            text_segment = text[start_index:end_index]
-            format_info = run.get('format', {})
-
-            # Check if this segment is bold
-            if format_info.get('bold', False):
-                text_segment = f"<b>{text_segment}</b>"
+    if not text_format_runs:
+        # Common case: whole cell shares one format - check if it is bold
+        try:
+            is_bold = cell_data['effectiveFormat']['textFormat']['bold']
+        except KeyError:
+            is_bold = False
 
-            result.append(text_segment)
+        return f"<b>{formatted_value}</b>" if is_bold else formatted_value
 
-        return ''.join(result)
-    else:
-        # Check if entire cell is bold
-        effective_format = cell_data.get('effectiveFormat', {})
-        text_format = effective_format.get('textFormat', {})
+    # Cell has mixed formatting - process each run
+    result = []
+    text = formatted_value
 
-        if text_format.get('bold', False):
-            return f"<b>{formatted_value}</b>"
+    for i, run in enumerate(text_format_runs):
+        start_index = run.get('startIndex', 0)
+        # Get end index from next run, or end of string
+        end_index = text_format_runs[i + 1].get('startIndex', len(text)) if i + 1 < len(text_format_runs) else len(text)
 
-        return formatted_value
+        text_segment = text[start_index:end_index]
+        format_info = run.get('format', {})
 
+        # Check if this segment is bold
+        if format_info.get('bold', False):
+            text_segment = f"<b>{text_segment}</b>"
 
-def load_words_from_sheet(spreadsheet_id: str, sheet_name: str) -> List[Dict[str, str]]:
-    """Load words from Google Sheet with English and French columns, preserving formatting."""
-    try:
-        client = get_google_sheets_client()
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        worksheet = spreadsheet.worksheet(sheet_name)
+        result.append(text_segment)
 
-        # Get data with formatting information
-        # We need to use the API directly to get formatting
-        sheet_data = spreadsheet.fetch_sheet_metadata({
-            'includeGridData': True,
-            'ranges': [f'{sheet_name}!A1:B']
-        })
+    return ''.join(result)
 
-        # Find our sheet in the metadata
-        sheet_info = None
-        for sheet in sheet_data.get('sheets', []):
-            if sheet.get('properties', {}).get('title') == sheet_name:
-                sheet_info = sheet
-                break
 
-        if not sheet_info:
-            raise Exception(f"Could not find sheet '{sheet_name}' in metadata")
+def parse_sheet_rows(row_data: list) -> List[Dict[str, str]]:
+    """Convert Google Sheets grid row data into word dicts, preserving formatting."""
+    if not row_data:
+        return []
 
-        # Get the grid data
-        grid_data = sheet_info.get('data', [{}])[0]
-        row_data = grid_data.get('rowData', [])
+    # Check header row to detect if columns are swapped
+    header_cells = row_data[0].get('values', [])
+    col1_header = header_cells[0].get('formattedValue', '').strip().lower() if len(header_cells) > 0 else ''
+    col2_header = header_cells[1].get('formattedValue', '').strip().lower() if len(header_cells) > 1 else ''
 
-        if not row_data:
-            return []
+    # Detect if columns are swapped (French, English instead of English, French)
+    columns_swapped = col1_header == 'french' and col2_header == 'english'
 
-        # Check header row to detect if columns are swapped
-        header_cells = row_data[0].get('values', [])
-        col1_header = header_cells[0].get('formattedValue', '').strip().lower() if len(header_cells) > 0 else ''
-        col2_header = header_cells[1].get('formattedValue', '').strip().lower() if len(header_cells) > 1 else ''
+    # Only the French column keeps its formatting; the other is plain text.
+    # Decide once here rather than branching on every cell.
+    format_col1 = apply_text_formatting if columns_swapped else get_plain_cell_text
+    format_col2 = get_plain_cell_text if columns_swapped else apply_text_formatting
 
-        # Detect if columns are swapped (French, English instead of English, French)
-        columns_swapped = col1_header == 'french' and col2_header == 'english'
+    # Skip header row and process data rows
+    words = []
+    for row in row_data[1:]:
+        cells = row.get('values', ())
+
+        # Rows need both columns - this also guarantees cells[0] and cells[1] exist
+        if len(cells) < 2:
+            continue
+
+        # Get column A text
+        col1_text = format_col1(cells[0])
+
+        if not col1_text:
+            continue
+
+        # Get column B text
+        col2_text = format_col2(cells[1])
+
+        # Convert newlines to <br> tags for proper display in Anki
+        col1_text = col1_text.replace('\n', '<br>').strip()
+        col2_text = col2_text.replace('\n', '<br>').strip()
+
+        if columns_swapped:
+            # Column A is French, Column B is English
+            # Card front shows French, back shows English
+            # Audio uses French text
+            words.append({
+                'English': col1_text,  # Actually French - will appear on front
+                'French': col2_text,   # Actually English - will appear on back
+                'AudioText': col1_text  # French text for audio
+            })
+        else:
+            # Normal: Column A is English, Column B is French
+            words.append({
+                'English': col1_text,
+                'French': col2_text,
+                'AudioText': col2_text  # French text for audio
+            })
 
-        # Skip header row and process data rows
-        words = []
-        for i, row in enumerate(row_data[1:], start=2):  # Start from row 2 (skip header)
-            cells = row.get('values', [])
+    return words
 
-            if len(cells) < 2:
-                continue
 
-            # Get column A text
-            col1_cell = cells[0] if len(cells) > 0 else {}
-            col1_text = apply_text_formatting(col1_cell) if columns_swapped else col1_cell.get('formattedValue', '').strip()
+def load_all_sheets(spreadsheet: gspread.Spreadsheet, sheet_names: List[str]) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Load words from several sheets with a single API request.
+    Returns a dict mapping sheet name to its list of words.
+    """
+    try:
+        # Get data with formatting information for every sheet at once
+        # We need to use the API directly to get formatting
+        ranges = []
+        for sheet_name in sheet_names:
+            quoted_name = sheet_name.replace("'", "''")
+            ranges.append(f"'{quoted_name}'!A1:B")
 
-            if not col1_text:
-                continue
+        sheet_data = spreadsheet.fetch_sheet_metadata({
+            'includeGridData': True,
+            'ranges': ranges
+        })
 
-            # Get column B text - with formatting if it's the French column
-            col2_cell = cells[1] if len(cells) > 1 else {}
-            col2_text = col2_cell.get('formattedValue', '').strip() if columns_swapped else apply_text_formatting(col2_cell)
+        sheets_by_title = {
+            sheet.get('properties', {}).get('title'): sheet
+            for sheet in sheet_data.get('sheets', [])
+        }
 
-            # Convert newlines to <br> tags for proper display in Anki
-            col1_text = col1_text.replace('\n', '<br>')
-            col2_text = col2_text.replace('\n', '<br>')
+        all_words = {}
+        for sheet_name in sheet_names:
+            sheet_info = sheets_by_title.get(sheet_name)
+            if not sheet_info:
+                print(f"Error: Sheet '{sheet_name}' not found in spreadsheet.")
+                sys.exit(1)
 
-            if columns_swapped:
-                # Column A is French, Column B is English
-                # Card front shows French, back shows English
-                # Audio uses French text
-                words.append({
-                    'English': col1_text.strip(),  # Actually French - will appear on front
-                    'French': col2_text.strip(),   # Actually English - will appear on back
-                    'AudioText': col1_text.strip()  # French text for audio
-                })
-            else:
-                # Normal: Column A is English, Column B is French
-                words.append({
-                    'English': col1_text.strip(),
-                    'French': col2_text.strip(),
-                    'AudioText': col2_text.strip()  # French text for audio
-                })
+            # Get the grid data
+            grid_data = sheet_info.get('data', [{}])[0]
+            all_words[sheet_name] = parse_sheet_rows(grid_data.get('rowData', []))
 
-        return words
+        return all_words
 
-    except gspread.exceptions.SpreadsheetNotFound:
-        print(f"Error: Spreadsheet with ID '{spreadsheet_id}' not found.")
-        print("Check that the spreadsheet ID is correct and shared with your service account.")
-        sys.exit(1)
-    except gspread.exceptions.WorksheetNotFound:
-        print(f"Error: Sheet '{sheet_name}' not found in spreadsheet.")
-        sys.exit(1)
     except Exception as e:
         print(f"Error loading Google Sheet: {e}")
         sys.exit(1)
@@ -385,15 +665,27 @@ def load_words_from_sheet(spreadsheet_id: str, sheet_name: str) -> List[Dict[str
 
 def compute_sheet_hash(words: List[Dict[str, str]]) -> str:
     """Compute hash of sheet content for caching."""
-    # Create a deterministic string representation of the data
-    content = json.dumps(words, sort_keys=True, ensure_ascii=False)
-    return hashlib.md5(content.encode('utf-8')).hexdigest()
+    # Feed fields to the hasher one at a time instead of serializing the whole
+    # sheet first. Rows are sorted since card order is shuffled anyway.
+    content_hash = hashlib.blake2b(digest_size=16)
+    for word in sorted(words, key=lambda w: (w['English'], w['French'], w['AudioText'])):
+        content_hash.update(word['English'].encode('utf-8'))
+        content_hash.update(b'\x1f')  # Field separator
+        content_hash.update(word['French'].encode('utf-8'))
+        content_hash.update(b'\x1f')
+        content_hash.update(word['AudioText'].encode('utf-8'))
+        content_hash.update(b'\x1e')  # Row separator
+    return content_hash.hexdigest()
 
 
 def load_cache() -> Dict[str, Dict[str, str]]:
     """Load cache from disk."""
     if os.path.exists(config.SHEET_CACHE_FILE):
         try:
+            if orjson is not None:
+                with open(config.SHEET_CACHE_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
+
             with open(config.SHEET_CACHE_FILE, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
@@ -405,15 +697,19 @@ def load_cache() -> Dict[str, Dict[str, str]]:
 def save_cache(cache: Dict[str, Dict[str, str]]):
     """Save cache to disk."""
     try:
+        if orjson is not None:
+            with open(config.SHEET_CACHE_FILE, 'wb') as f:
+                f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+            return
+
         with open(config.SHEET_CACHE_FILE, 'w', encoding='utf-8') as f:
             json.dump(cache, f, indent=2, ensure_ascii=False)
     except Exception as e:
         print(f"Warning: Could not save cache file: {e}")
 
 
-def is_sheet_cached(spreadsheet_id: str, sheet_name: str, current_hash: str) -> bool:
+def is_sheet_cached(cache: Dict[str, Dict[str, str]], spreadsheet_id: str, sheet_name: str, current_hash: str) -> bool:
     """Check if sheet content matches cached hash."""
-    cache = load_cache()
     cache_key = f"{spreadsheet_id}:{sheet_name}"
 
     if cache_key in cache:
@@ -423,30 +719,75 @@ def is_sheet_cached(spreadsheet_id: str, sheet_name: str, current_hash: str) ->
     return False
 
 
-def update_cache(spreadsheet_id: str, sheet_name: str, content_hash: str, output_file: str):
-    """Update cache with new sheet hash and output file."""
-    cache = load_cache()
+def is_sheet_empty(cache: Dict[str, Dict[str, str]], spreadsheet_id: str, sheet_name: str) -> bool:
+    """Check if the sheet had no words when it was last loaded."""
+    cache_key = f"{spreadsheet_id}:{sheet_name}"
+
+    if cache_key in cache:
+        cached_entry = cache[cache_key]
+        return cached_entry.get('empty', False)
+
+    return False
+
+
+def is_sheet_unmodified(cache: Dict[str, Dict[str, str]], spreadsheet_id: str, sheet_name: str, modified_time: Optional[str]) -> bool:
+    """Check if the spreadsheet is unchanged since this sheet was last generated (or found empty)."""
+    if not modified_time:
+        return False
+
+    cache_key = f"{spreadsheet_id}:{sheet_name}"
+
+    if cache_key in cache:
+        cached_entry = cache[cache_key]
+        if cached_entry.get('modified_time') != modified_time:
+            return False
+
+        # Empty sheets have no deck, so there is no output file to check
+        if cached_entry.get('empty'):
+            return True
+
+        return os.path.exists(os.path.join(config.OUTPUT_DIR, get_sheet_output_filename(sheet_name)))
+
+    return False
+
+
+def update_cache(cache: Dict[str, Dict[str, str]], spreadsheet_id: str, sheet_name: str, content_hash: str, output_file: str,
+                 modified_time: Optional[str] = None):
+    """Update in-memory cache with new sheet hash and output file (call save_cache to persist)."""
     cache_key = f"{spreadsheet_id}:{sheet_name}"
 
     cache[cache_key] = {
         'hash': content_hash,
+        'modified_time': modified_time,
         'output_file': output_file,
         'last_generated': os.path.getmtime(os.path.join(config.OUTPUT_DIR, output_file)) if os.path.exists(os.path.join(config.OUTPUT_DIR, output_file)) else None
     }
 
-    save_cache(cache)
+
+def update_cache_empty(cache: Dict[str, Dict[str, str]], spreadsheet_id: str, sheet_name: str, modified_time: Optional[str]):
+    """Record in the in-memory cache that a sheet has no words (call save_cache to persist)."""
+    cache_key = f"{spreadsheet_id}:{sheet_name}"
+
+    cache[cache_key] = {
+        'empty': True,
+        'modified_time': modified_time
+    }
+
+
+def get_sheet_output_filename(sheet_name: str) -> str:
+    """Get output filename from sheet name (preserve case, replace spaces with underscores)."""
+    return f"{sheet_name.replace(' ', '_')}.apkg"
+
+
+def get_deck_name(name: str) -> str:
+    """Convert a file or sheet name to a deck name (e.g., 'example_words' -> 'Example Words')."""
+    return name.replace('_', ' ').title()
 
 
 def get_deck_name_from_filename(filename: str) -> str:
     """Convert filename to deck name (e.g., 'example_words.csv' -> 'Example Words')."""
-    # Get just the basename without path
-    basename = os.path.basename(filename)
-    # Remove .csv extension
-    name = basename.replace('.csv', '')
-    # Replace underscores with spaces
-    name = name.replace('_', ' ')
-    # Capitalize each word
-    return name.title()
+    # Drop the directory and extension (splitext also handles '.CSV')
+    return get_deck_name(os.path.splitext(os.path.basename(filename))[0])
 
 
 def main():
@@ -487,6 +828,8 @@ def main():
         print("=" * 50)
         print(f"Spreadsheet ID: {spreadsheet_id}")
 
+        spreadsheet = open_spreadsheet(spreadsheet_id)
+
         # Determine which sheets to process
         if sheet_name:
             # Process single sheet
@@ -495,55 +838,115 @@ def main():
         else:
             # Process all sheets
             print("Getting all sheets from spreadsheet...")
-            sheet_names = get_all_sheet_names(spreadsheet_id)
+            sheet_names = get_all_sheet_names(spreadsheet)
             print(f"Found {len(sheet_names)} sheets: {', '.join(sheet_names)}")
 
         print("\n" + "=" * 50)
 
-        # Process each sheet
-        for idx, current_sheet_name in enumerate(sheet_names, 1):
-            if len(sheet_names) > 1:
-                print(f"\n[{idx}/{len(sheet_names)}] Processing sheet: {current_sheet_name}")
-                print("-" * 50)
+        # Load the cache once; it is written back a single time after the loop
+        cache = load_cache()
+
+        # One Drive lookup tells us whether anything in the workbook changed,
+        # which lets unchanged sheets be skipped without downloading their rows
+        modified_time = get_spreadsheet_modified_time(spreadsheet)
+
+        sheets_to_load = []
+        for current_sheet_name in sheet_names:
+            if is_sheet_unmodified(cache, spreadsheet_id, current_sheet_name, modified_time):
+                if is_sheet_empty(cache, spreadsheet_id, current_sheet_name):
+                    print(f"Skipping empty sheet: {current_sheet_name} (spreadsheet unchanged)")
+                else:
+                    output_filename = get_sheet_output_filename(current_sheet_name)
+                    print(f"✓ Skipping '{current_sheet_name}' - spreadsheet unchanged (using cached {output_filename})")
+                continue
+
+            sheets_to_load.append(current_sheet_name)
+
+        # Fetch the remaining sheets in one request rather than one request per sheet
+        all_words = load_all_sheets(spreadsheet, sheets_to_load) if sheets_to_load else {}
 
-            # Load words from Google Sheets
-            words = load_words_from_sheet(spreadsheet_id, current_sheet_name)
+        # Work out which sheets changed before doing any slow work
+        changed_sheets = []
+        for current_sheet_name in sheets_to_load:
+            words = all_words[current_sheet_name]
 
             if not words:
-                print(f"Skipping empty sheet: {current_sheet_name}\n")
+                print(f"Skipping empty sheet: {current_sheet_name}")
+                # Cache it as empty so the next run doesn't download it again
+                update_cache_empty(cache, spreadsheet_id, current_sheet_name, modified_time)
                 continue
 
-            # Get output filename from sheet name (preserve case, replace spaces with underscores)
-            output_filename = f"{current_sheet_name.replace(' ', '_')}.apkg"
+            output_filename = get_sheet_output_filename(current_sheet_name)
             output_path = os.path.join(config.OUTPUT_DIR, output_filename)
 
             # Compute hash of sheet content
             content_hash = compute_sheet_hash(words)
 
             # Check if sheet is already cached and output file exists
-            if is_sheet_cached(spreadsheet_id, current_sheet_name, content_hash) and os.path.exists(output_path):
+            if is_sheet_cached(cache, spreadsheet_id, current_sheet_name, content_hash) and os.path.exists(output_path):
                 print(f"✓ Skipping '{current_sheet_name}' - no changes detected (using cached {output_filename})")
+                # Record the new modified time so the next run can skip the download
+                update_cache(cache, spreadsheet_id, current_sheet_name, content_hash, output_filename, modified_time)
                 continue
 
-            # Sheet has changed or doesn't exist, generate deck
-            # Randomize the order of words
-            random.shuffle(words)
+            changed_sheets.append((current_sheet_name, words, content_hash, output_filename))
 
-            # Create deck name from sheet name
-            deck_name = current_sheet_name.replace('_', ' ').title()
+        # Fetch audio for every changed sheet in one pool, so one sheet's
+        # slow requests don't hold up the next sheet's downloads
+        if changed_sheets:
+            print(f"\nGenerating audio for {len(changed_sheets)} sheet(s)...")
+            prefetch_audio([words for _, words, _, _ in changed_sheets])
 
-            print(f"Deck: {deck_name}")
-            print(f"Processing {len(words)} words...\n")
+        # Write .apkg files on a background thread so packaging one deck
+        # overlaps with building the next one
+        packager = ThreadPoolExecutor(max_workers=1)
+        pending_saves = []
 
-            generator = FrenchFlashcardGenerator(deck_name=deck_name)
-            results = generator.process_words(words)
-
-            # Save outputs
-            print("\n" + "-" * 50)
-            generator.save_deck(output_filename)
-
-            # Update cache with new hash
-            update_cache(spreadsheet_id, current_sheet_name, content_hash, output_filename)
+        # Process each changed sheet
+        try:
+            for idx, (current_sheet_name, words, content_hash, output_filename) in enumerate(changed_sheets, 1):
+                if len(changed_sheets) > 1:
+                    print(f"\n[{idx}/{len(changed_sheets)}] Processing sheet: {current_sheet_name}")
+                    print("-" * 50)
+
+                # Sheet has changed or doesn't exist, generate deck
+                # Randomize the order of words
+                random.shuffle(words)
+
+                # Create deck name from sheet name
+                deck_name = get_deck_name(current_sheet_name)
+
+                print(f"Deck: {deck_name}")
+                print(f"Processing {len(words)} words...\n")
+
+                generator = FrenchFlashcardGenerator(deck_name=deck_name)
+                results = generator.process_words(words)
+
+                # Save outputs
+                print("\n" + "-" * 50)
+                save_future = packager.submit(generator.save_deck, output_filename)
+
+                # A deck with missing audio is saved but not cached, so the
+                # next run rebuilds it and retries the failed downloads
+                audio_complete = generator.audio_failures == 0
+                if not audio_complete:
+                    print(f"'{current_sheet_name}' will be regenerated on the next run to retry missing audio")
+
+                pending_saves.append((save_future, current_sheet_name, content_hash, output_filename, audio_complete))
+        finally:
+            # Wait for outstanding decks, then update cache with new hashes
+            # for every complete deck that was written successfully
+            packager.shutdown(wait=True)
+            for save_future, saved_sheet_name, content_hash, output_filename, audio_complete in pending_saves:
+                if audio_complete and save_future.exception() is None:
+                    update_cache(cache, spreadsheet_id, saved_sheet_name, content_hash, output_filename, modified_time)
+            save_cache(cache)
+
+        # Surface any packaging error now that the cache is saved
+        for save_future, _, _, _, _ in pending_saves:
+            save_future.result()
+
+        prune_audio_cache(config.AUDIO_CACHE_MAX_AGE_DAYS)
 
         print("\n" + "=" * 50)
         print("\nDone! Import the .apkg file(s) into Anki to use your flashcards.")
@@ -568,8 +971,8 @@ def main():
         deck_name = get_deck_name_from_filename(csv_filename)
 
         # Get output filename from input basename
-        basename = os.path.basename(csv_filename)
-        output_filename = basename.replace('.csv', '.apkg')
+        basename = os.path.splitext(os.path.basename(csv_filename))[0]
+        output_filename = f"{basename}.apkg"
 
         print("French Flashcard Generator")
         print("=" * 50)
@@ -584,6 +987,8 @@ def main():
         print("\n" + "=" * 50)
         generator.save_deck(output_filename)
 
+        prune_audio_cache(config.AUDIO_CACHE_MAX_AGE_DAYS)
+
         print("\nDone! Import the .apkg file into Anki to use your flashcards.")
 
 